@@ -39,6 +39,37 @@ pub unsafe extern "C" fn culsynth_amp_u16_process(
     out_slice.len() as i32
 }
 
+#[no_mangle]
+pub unsafe extern "C" fn culsynth_amp_u16_process_into(
+    p: *mut AmpFxP,
+    samples: u32,
+    signal: *const i16,
+    gain: *const i16,
+    out: *mut u16,
+) -> i32 {
+    if p.is_null() || out.is_null() {
+        return -1;
+    }
+    let mut processed: u32 = 0;
+    while processed < samples {
+        let mut out_buf: *const u16 = std::ptr::null();
+        let n = culsynth_amp_u16_process(
+            p,
+            samples - processed,
+            signal,
+            gain,
+            &mut out_buf,
+            processed,
+        );
+        if n <= 0 {
+            return n;
+        }
+        std::ptr::copy_nonoverlapping(out_buf, out.offset(processed as isize), n as usize);
+        processed += n as u32;
+    }
+    processed as i32
+}
+
 #[no_mangle]
 pub extern "C" fn culsynth_amp_f32_new() -> *mut Amp<f32> {
     Box::into_raw(Box::new(Amp::new()))
@@ -70,6 +101,37 @@ pub unsafe extern "C" fn culsynth_amp_f32_process(
     out_slice.len() as i32
 }
 
+#[no_mangle]
+pub unsafe extern "C" fn culsynth_amp_f32_process_into(
+    p: *mut Amp<f32>,
+    samples: u32,
+    signal: *const f32,
+    gain: *const f32,
+    out: *mut f32,
+) -> i32 {
+    if p.is_null() || out.is_null() {
+        return -1;
+    }
+    let mut processed: u32 = 0;
+    while processed < samples {
+        let mut out_buf: *const f32 = std::ptr::null();
+        let n = culsynth_amp_f32_process(
+            p,
+            samples - processed,
+            signal,
+            gain,
+            &mut out_buf,
+            processed,
+        );
+        if n <= 0 {
+            return n;
+        }
+        std::ptr::copy_nonoverlapping(out_buf, out.offset(processed as isize), n as usize);
+        processed += n as u32;
+    }
+    processed as i32
+}
+
 #[no_mangle]
 pub extern "C" fn culsynth_env_u16_new() -> *mut EnvFxP {
     Box::into_raw(Box::new(EnvFxP::new()))
@@ -136,6 +198,43 @@ pub unsafe extern "C" fn culsynth_env_u16_process(
     out.len() as i32
 }
 
+#[no_mangle]
+pub unsafe extern "C" fn culsynth_env_u16_process_into(
+    p: *mut EnvFxP,
+    samples: u32,
+    gate: *const i16,
+    attack: *const u16,
+    decay: *const u16,
+    sustain: *const u16,
+    release: *const u16,
+    signal: *mut u16,
+) -> i32 {
+    if p.is_null() || signal.is_null() {
+        return -1;
+    }
+    let mut processed: u32 = 0;
+    while processed < samples {
+        let mut signal_buf: *const u16 = std::ptr::null();
+        let n = culsynth_env_u16_process(
+            p,
+            samples - processed,
+            gate,
+            attack,
+            decay,
+            sustain,
+            release,
+            &mut signal_buf,
+            processed,
+        );
+        if n <= 0 {
+            return n;
+        }
+        std::ptr::copy_nonoverlapping(signal_buf, signal.offset(processed as isize), n as usize);
+        processed += n as u32;
+    }
+    processed as i32
+}
+
 #[no_mangle]
 pub extern "C" fn culsynth_env_f32_new() -> *mut Env<f32> {
     Box::into_raw(Box::new(Env::new()))
@@ -190,6 +289,43 @@ pub unsafe extern "C" fn culsynth_env_f32_process(
     out.len() as i32
 }
 
+#[no_mangle]
+pub unsafe extern "C" fn culsynth_env_f32_process_into(
+    p: *mut Env<f32>,
+    samples: u32,
+    gate: *const f32,
+    attack: *const f32,
+    decay: *const f32,
+    sustain: *const f32,
+    release: *const f32,
+    signal: *mut f32,
+) -> i32 {
+    if p.is_null() || signal.is_null() {
+        return -1;
+    }
+    let mut processed: u32 = 0;
+    while processed < samples {
+        let mut signal_buf: *const f32 = std::ptr::null();
+        let n = culsynth_env_f32_process(
+            p,
+            samples - processed,
+            gate,
+            attack,
+            decay,
+            sustain,
+            release,
+            &mut signal_buf,
+            processed,
+        );
+        if n <= 0 {
+            return n;
+        }
+        std::ptr::copy_nonoverlapping(signal_buf, signal.offset(processed as isize), n as usize);
+        processed += n as u32;
+    }
+    processed as i32
+}
+
 #[no_mangle]
 pub extern "C" fn culsynth_filt_u16_new() -> *mut FiltFxP {
     Box::into_raw(Box::new(FiltFxP::new()))
@@ -249,6 +385,47 @@ pub unsafe extern "C" fn culsynth_filt_u16_process(
     out.low.len() as i32
 }
 
+#[no_mangle]
+pub unsafe extern "C" fn culsynth_filt_u16_process_into(
+    p: *mut FiltFxP,
+    samples: u32,
+    input: *const i16,
+    cutoff: *const u16,
+    resonance: *const u16,
+    low: *mut i16,
+    band: *mut i16,
+    high: *mut i16,
+) -> i32 {
+    if p.is_null() || low.is_null() || band.is_null() || high.is_null() {
+        return -1;
+    }
+    let mut processed: u32 = 0;
+    while processed < samples {
+        let mut low_buf: *const i16 = std::ptr::null();
+        let mut band_buf: *const i16 = std::ptr::null();
+        let mut high_buf: *const i16 = std::ptr::null();
+        let n = culsynth_filt_u16_process(
+            p,
+            samples - processed,
+            input,
+            cutoff,
+            resonance,
+            &mut low_buf,
+            &mut band_buf,
+            &mut high_buf,
+            processed,
+        );
+        if n <= 0 {
+            return n;
+        }
+        std::ptr::copy_nonoverlapping(low_buf, low.offset(processed as isize), n as usize);
+        std::ptr::copy_nonoverlapping(band_buf, band.offset(processed as isize), n as usize);
+        std::ptr::copy_nonoverlapping(high_buf, high.offset(processed as isize), n as usize);
+        processed += n as u32;
+    }
+    processed as i32
+}
+
 #[no_mangle]
 pub extern "C" fn culsynth_filt_f32_new() -> *mut Filt<f32> {
     Box::into_raw(Box::new(Filt::new()))
@@ -301,6 +478,47 @@ pub unsafe extern "C" fn culsynth_filt_f32_process(
     out.low.len() as i32
 }
 
+#[no_mangle]
+pub unsafe extern "C" fn culsynth_filt_f32_process_into(
+    p: *mut Filt<f32>,
+    samples: u32,
+    input: *const f32,
+    cutoff: *const f32,
+    resonance: *const f32,
+    low: *mut f32,
+    band: *mut f32,
+    high: *mut f32,
+) -> i32 {
+    if p.is_null() || low.is_null() || band.is_null() || high.is_null() {
+        return -1;
+    }
+    let mut processed: u32 = 0;
+    while processed < samples {
+        let mut low_buf: *const f32 = std::ptr::null();
+        let mut band_buf: *const f32 = std::ptr::null();
+        let mut high_buf: *const f32 = std::ptr::null();
+        let n = culsynth_filt_f32_process(
+            p,
+            samples - processed,
+            input,
+            cutoff,
+            resonance,
+            &mut low_buf,
+            &mut band_buf,
+            &mut high_buf,
+            processed,
+        );
+        if n <= 0 {
+            return n;
+        }
+        std::ptr::copy_nonoverlapping(low_buf, low.offset(processed as isize), n as usize);
+        std::ptr::copy_nonoverlapping(band_buf, band.offset(processed as isize), n as usize);
+        std::ptr::copy_nonoverlapping(high_buf, high.offset(processed as isize), n as usize);
+        processed += n as u32;
+    }
+    processed as i32
+}
+
 #[no_mangle]
 pub extern "C" fn culsynth_osc_u16_new() -> *mut OscFxP {
     Box::into_raw(Box::new(OscFxP::new()))
@@ -363,6 +581,51 @@ pub unsafe extern "C" fn culsynth_osc_u16_process(
     out.sin.len() as i32
 }
 
+#[no_mangle]
+pub unsafe extern "C" fn culsynth_osc_u16_process_into(
+    p: *mut OscFxP,
+    samples: u32,
+    note: *const u16,
+    tune: *const i16,
+    shape: *const u16,
+    sin: *mut i16,
+    tri: *mut i16,
+    sq: *mut i16,
+    saw: *mut i16,
+) -> i32 {
+    if p.is_null() || sin.is_null() || tri.is_null() || sq.is_null() || saw.is_null() {
+        return -1;
+    }
+    let mut processed: u32 = 0;
+    while processed < samples {
+        let mut sin_buf: *const i16 = std::ptr::null();
+        let mut tri_buf: *const i16 = std::ptr::null();
+        let mut sq_buf: *const i16 = std::ptr::null();
+        let mut saw_buf: *const i16 = std::ptr::null();
+        let n = culsynth_osc_u16_process(
+            p,
+            samples - processed,
+            note,
+            tune,
+            shape,
+            &mut sin_buf,
+            &mut tri_buf,
+            &mut sq_buf,
+            &mut saw_buf,
+            processed,
+        );
+        if n <= 0 {
+            return n;
+        }
+        std::ptr::copy_nonoverlapping(sin_buf, sin.offset(processed as isize), n as usize);
+        std::ptr::copy_nonoverlapping(tri_buf, tri.offset(processed as isize), n as usize);
+        std::ptr::copy_nonoverlapping(sq_buf, sq.offset(processed as isize), n as usize);
+        std::ptr::copy_nonoverlapping(saw_buf, saw.offset(processed as isize), n as usize);
+        processed += n as u32;
+    }
+    processed as i32
+}
+
 #[no_mangle]
 pub extern "C" fn culsynth_osc_f32_new() -> *mut Osc<f32> {
     Box::into_raw(Box::new(Osc::<f32>::new()))
@@ -418,3 +681,423 @@ pub unsafe extern "C" fn culsynth_osc_f32_process(
     *saw = out.saw.as_ptr().cast();
     out.sin.len() as i32
 }
+
+#[no_mangle]
+pub unsafe extern "C" fn culsynth_osc_f32_process_into(
+    p: *mut Osc<f32>,
+    samples: u32,
+    note: *const f32,
+    tune: *const f32,
+    shape: *const f32,
+    sin: *mut f32,
+    tri: *mut f32,
+    sq: *mut f32,
+    saw: *mut f32,
+) -> i32 {
+    if p.is_null() || sin.is_null() || tri.is_null() || sq.is_null() || saw.is_null() {
+        return -1;
+    }
+    let mut processed: u32 = 0;
+    while processed < samples {
+        let mut sin_buf: *const f32 = std::ptr::null();
+        let mut tri_buf: *const f32 = std::ptr::null();
+        let mut sq_buf: *const f32 = std::ptr::null();
+        let mut saw_buf: *const f32 = std::ptr::null();
+        let n = culsynth_osc_f32_process(
+            p,
+            samples - processed,
+            note,
+            tune,
+            shape,
+            &mut sin_buf,
+            &mut tri_buf,
+            &mut sq_buf,
+            &mut saw_buf,
+            processed,
+        );
+        if n <= 0 {
+            return n;
+        }
+        std::ptr::copy_nonoverlapping(sin_buf, sin.offset(processed as isize), n as usize);
+        std::ptr::copy_nonoverlapping(tri_buf, tri.offset(processed as isize), n as usize);
+        std::ptr::copy_nonoverlapping(sq_buf, sq.offset(processed as isize), n as usize);
+        std::ptr::copy_nonoverlapping(saw_buf, saw.offset(processed as isize), n as usize);
+        processed += n as u32;
+    }
+    processed as i32
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    // Larger than the devices' internal buffers, so both paths need to chunk
+    const SAMPLES: usize = 1000;
+
+    // Runs the old chunked `_process` + offset loop, copying out each chunk
+    unsafe fn collect_chunks<T: Copy>(
+        outs: &mut [Vec<T>],
+        mut process: impl FnMut(u32, u32, &mut [*const T]) -> i32,
+    ) {
+        let mut processed: u32 = 0;
+        while (processed as usize) < SAMPLES {
+            let mut bufs = vec![std::ptr::null(); outs.len()];
+            let n = process(SAMPLES as u32 - processed, processed, &mut bufs);
+            assert!(n > 0);
+            for (out, buf) in outs.iter_mut().zip(bufs) {
+                out.extend_from_slice(std::slice::from_raw_parts(buf, n as usize));
+            }
+            processed += n as u32;
+        }
+    }
+
+    #[test]
+    fn osc_u16_process_into_matches_chunked() {
+        let note: Vec<u16> = (0..SAMPLES).map(|i| (60 << 9) + (i as u16 % 512)).collect();
+        let tune = vec![0i16; SAMPLES];
+        let shape: Vec<u16> = (0..SAMPLES).map(|i| (i as u16) << 6).collect();
+        let mut into = vec![vec![0i16; SAMPLES]; 4];
+        let mut chunked: Vec<Vec<i16>> = vec![Vec::new(); 4];
+        unsafe {
+            let p = culsynth_osc_u16_new();
+            let [sin, tri, sq, saw] = &mut into[..] else {
+                unreachable!()
+            };
+            let n = culsynth_osc_u16_process_into(
+                p,
+                SAMPLES as u32,
+                note.as_ptr(),
+                tune.as_ptr(),
+                shape.as_ptr(),
+                sin.as_mut_ptr(),
+                tri.as_mut_ptr(),
+                sq.as_mut_ptr(),
+                saw.as_mut_ptr(),
+            );
+            assert_eq!(n, SAMPLES as i32);
+            culsynth_osc_u16_free(p);
+
+            let p = culsynth_osc_u16_new();
+            collect_chunks(&mut chunked, |samples, offset, bufs| {
+                let [sin, tri, sq, saw] = bufs else {
+                    unreachable!()
+                };
+                culsynth_osc_u16_process(
+                    p,
+                    samples,
+                    note.as_ptr(),
+                    tune.as_ptr(),
+                    shape.as_ptr(),
+                    sin,
+                    tri,
+                    sq,
+                    saw,
+                    offset,
+                )
+            });
+            culsynth_osc_u16_free(p);
+        }
+        assert_eq!(into, chunked);
+    }
+
+    #[test]
+    fn filt_u16_process_into_matches_chunked() {
+        let input: Vec<i16> = (0..SAMPLES).map(|i| ((i as i16) << 7) ^ 0x1234).collect();
+        let cutoff = vec![69u16 << 9; SAMPLES];
+        let resonance: Vec<u16> = (0..SAMPLES).map(|i| (i as u16) << 5).collect();
+        let mut into = vec![vec![0i16; SAMPLES]; 3];
+        let mut chunked: Vec<Vec<i16>> = vec![Vec::new(); 3];
+        unsafe {
+            let p = culsynth_filt_u16_new();
+            let [low, band, high] = &mut into[..] else {
+                unreachable!()
+            };
+            let n = culsynth_filt_u16_process_into(
+                p,
+                SAMPLES as u32,
+                input.as_ptr(),
+                cutoff.as_ptr(),
+                resonance.as_ptr(),
+                low.as_mut_ptr(),
+                band.as_mut_ptr(),
+                high.as_mut_ptr(),
+            );
+            assert_eq!(n, SAMPLES as i32);
+            culsynth_filt_u16_free(p);
+
+            let p = culsynth_filt_u16_new();
+            collect_chunks(&mut chunked, |samples, offset, bufs| {
+                let [low, band, high] = bufs else {
+                    unreachable!()
+                };
+                culsynth_filt_u16_process(
+                    p,
+                    samples,
+                    input.as_ptr(),
+                    cutoff.as_ptr(),
+                    resonance.as_ptr(),
+                    low,
+                    band,
+                    high,
+                    offset,
+                )
+            });
+            culsynth_filt_u16_free(p);
+        }
+        assert_eq!(into, chunked);
+    }
+
+    #[test]
+    fn env_u16_process_into_matches_chunked() {
+        let gate: Vec<i16> = (0..SAMPLES)
+            .map(|i| if i < 600 { 0x4000 } else { 0 })
+            .collect();
+        let attack = vec![0x0100u16; SAMPLES];
+        let decay = vec![0x0200u16; SAMPLES];
+        let sustain = vec![0x8000u16; SAMPLES];
+        let release = vec![0x0100u16; SAMPLES];
+        let mut into = vec![vec![0u16; SAMPLES]];
+        let mut chunked: Vec<Vec<u16>> = vec![Vec::new()];
+        unsafe {
+            let p = culsynth_env_u16_new();
+            let n = culsynth_env_u16_process_into(
+                p,
+                SAMPLES as u32,
+                gate.as_ptr(),
+                attack.as_ptr(),
+                decay.as_ptr(),
+                sustain.as_ptr(),
+                release.as_ptr(),
+                into[0].as_mut_ptr(),
+            );
+            assert_eq!(n, SAMPLES as i32);
+            culsynth_env_u16_free(p);
+
+            let p = culsynth_env_u16_new();
+            collect_chunks(&mut chunked, |samples, offset, bufs| {
+                culsynth_env_u16_process(
+                    p,
+                    samples,
+                    gate.as_ptr(),
+                    attack.as_ptr(),
+                    decay.as_ptr(),
+                    sustain.as_ptr(),
+                    release.as_ptr(),
+                    &mut bufs[0],
+                    offset,
+                )
+            });
+            culsynth_env_u16_free(p);
+        }
+        assert_eq!(into, chunked);
+    }
+
+    #[test]
+    fn amp_u16_process_into_matches_chunked() {
+        let signal: Vec<i16> = (0..SAMPLES).map(|i| ((i as i16) << 7) ^ 0x1234).collect();
+        let gain: Vec<i16> = (0..SAMPLES).map(|i| (i as i16) << 2).collect();
+        let mut into = vec![vec![0u16; SAMPLES]];
+        let mut chunked: Vec<Vec<u16>> = vec![Vec::new()];
+        unsafe {
+            let p = culsynth_amp_u16_new();
+            let n = culsynth_amp_u16_process_into(
+                p,
+                SAMPLES as u32,
+                signal.as_ptr(),
+                gain.as_ptr(),
+                into[0].as_mut_ptr(),
+            );
+            assert_eq!(n, SAMPLES as i32);
+            culsynth_amp_u16_free(p);
+
+            let p = culsynth_amp_u16_new();
+            collect_chunks(&mut chunked, |samples, offset, bufs| {
+                culsynth_amp_u16_process(
+                    p,
+                    samples,
+                    signal.as_ptr(),
+                    gain.as_ptr(),
+                    &mut bufs[0],
+                    offset,
+                )
+            });
+            culsynth_amp_u16_free(p);
+        }
+        assert_eq!(into, chunked);
+    }
+
+    #[test]
+    fn amp_f32_process_into_matches_chunked() {
+        let signal: Vec<f32> = (0..SAMPLES).map(|i| (i as f32 * 0.1).sin()).collect();
+        let gain: Vec<f32> = (0..SAMPLES).map(|i| i as f32 / SAMPLES as f32).collect();
+        let mut into = vec![vec![0f32; SAMPLES]];
+        let mut chunked: Vec<Vec<f32>> = vec![Vec::new()];
+        unsafe {
+            let p = culsynth_amp_f32_new();
+            let n = culsynth_amp_f32_process_into(
+                p,
+                SAMPLES as u32,
+                signal.as_ptr(),
+                gain.as_ptr(),
+                into[0].as_mut_ptr(),
+            );
+            assert_eq!(n, SAMPLES as i32);
+            culsynth_amp_f32_free(p);
+
+            let p = culsynth_amp_f32_new();
+            collect_chunks(&mut chunked, |samples, offset, bufs| {
+                culsynth_amp_f32_process(
+                    p,
+                    samples,
+                    signal.as_ptr(),
+                    gain.as_ptr(),
+                    &mut bufs[0],
+                    offset,
+                )
+            });
+            culsynth_amp_f32_free(p);
+        }
+        assert_eq!(into, chunked);
+    }
+
+    #[test]
+    fn osc_f32_process_into_matches_chunked() {
+        let note: Vec<f32> = (0..SAMPLES).map(|i| 60.0 + (i % 12) as f32).collect();
+        let tune = vec![0f32; SAMPLES];
+        let shape: Vec<f32> = (0..SAMPLES).map(|i| i as f32 / SAMPLES as f32).collect();
+        let mut into = vec![vec![0f32; SAMPLES]; 4];
+        let mut chunked: Vec<Vec<f32>> = vec![Vec::new(); 4];
+        unsafe {
+            let p = culsynth_osc_f32_new();
+            let [sin, tri, sq, saw] = &mut into[..] else {
+                unreachable!()
+            };
+            let n = culsynth_osc_f32_process_into(
+                p,
+                SAMPLES as u32,
+                note.as_ptr(),
+                tune.as_ptr(),
+                shape.as_ptr(),
+                sin.as_mut_ptr(),
+                tri.as_mut_ptr(),
+                sq.as_mut_ptr(),
+                saw.as_mut_ptr(),
+            );
+            assert_eq!(n, SAMPLES as i32);
+            culsynth_osc_f32_free(p);
+
+            let p = culsynth_osc_f32_new();
+            collect_chunks(&mut chunked, |samples, offset, bufs| {
+                let [sin, tri, sq, saw] = bufs else {
+                    unreachable!()
+                };
+                culsynth_osc_f32_process(
+                    p,
+                    samples,
+                    note.as_ptr(),
+                    tune.as_ptr(),
+                    shape.as_ptr(),
+                    sin,
+                    tri,
+                    sq,
+                    saw,
+                    offset,
+                )
+            });
+            culsynth_osc_f32_free(p);
+        }
+        assert_eq!(into, chunked);
+    }
+
+    #[test]
+    fn filt_f32_process_into_matches_chunked() {
+        let input: Vec<f32> = (0..SAMPLES).map(|i| (i as f32 * 0.1).sin()).collect();
+        let cutoff = vec![69f32; SAMPLES];
+        let resonance: Vec<f32> = (0..SAMPLES).map(|i| i as f32 / SAMPLES as f32).collect();
+        let mut into = vec![vec![0f32; SAMPLES]; 3];
+        let mut chunked: Vec<Vec<f32>> = vec![Vec::new(); 3];
+        unsafe {
+            let p = culsynth_filt_f32_new();
+            let [low, band, high] = &mut into[..] else {
+                unreachable!()
+            };
+            let n = culsynth_filt_f32_process_into(
+                p,
+                SAMPLES as u32,
+                input.as_ptr(),
+                cutoff.as_ptr(),
+                resonance.as_ptr(),
+                low.as_mut_ptr(),
+                band.as_mut_ptr(),
+                high.as_mut_ptr(),
+            );
+            assert_eq!(n, SAMPLES as i32);
+            culsynth_filt_f32_free(p);
+
+            let p = culsynth_filt_f32_new();
+            collect_chunks(&mut chunked, |samples, offset, bufs| {
+                let [low, band, high] = bufs else {
+                    unreachable!()
+                };
+                culsynth_filt_f32_process(
+                    p,
+                    samples,
+                    input.as_ptr(),
+                    cutoff.as_ptr(),
+                    resonance.as_ptr(),
+                    low,
+                    band,
+                    high,
+                    offset,
+                )
+            });
+            culsynth_filt_f32_free(p);
+        }
+        assert_eq!(into, chunked);
+    }
+
+    #[test]
+    fn env_f32_process_into_matches_chunked() {
+        let gate: Vec<f32> = (0..SAMPLES)
+            .map(|i| if i < 600 { 1.0 } else { 0.0 })
+            .collect();
+        let attack = vec![0.002f32; SAMPLES];
+        let decay = vec![0.005f32; SAMPLES];
+        let sustain = vec![0.5f32; SAMPLES];
+        let release = vec![0.002f32; SAMPLES];
+        let mut into = vec![vec![0f32; SAMPLES]];
+        let mut chunked: Vec<Vec<f32>> = vec![Vec::new()];
+        unsafe {
+            let p = culsynth_env_f32_new();
+            let n = culsynth_env_f32_process_into(
+                p,
+                SAMPLES as u32,
+                gate.as_ptr(),
+                attack.as_ptr(),
+                decay.as_ptr(),
+                sustain.as_ptr(),
+                release.as_ptr(),
+                into[0].as_mut_ptr(),
+            );
+            assert_eq!(n, SAMPLES as i32);
+            culsynth_env_f32_free(p);
+
+            let p = culsynth_env_f32_new();
+            collect_chunks(&mut chunked, |samples, offset, bufs| {
+                culsynth_env_f32_process(
+                    p,
+                    samples,
+                    gate.as_ptr(),
+                    attack.as_ptr(),
+                    decay.as_ptr(),
+                    sustain.as_ptr(),
+                    release.as_ptr(),
+                    &mut bufs[0],
+                    offset,
+                )
+            });
+            culsynth_env_f32_free(p);
+        }
+        assert_eq!(into, chunked);
+    }
+}
@@ -1,304 +1,443 @@
+"""Python bindings for the culsynth DSP devices.
+
+Each device is available in two flavors:
+
+- OscFxP, EnvFxP and FiltFxP use the 16-bit fixed-point implementations,
+  which are also what the embedded firmware runs.  Real-time callers
+  should prefer these: a block of i16 samples is half the size of the
+  equivalent f32 block, so each block moves half as much memory.
+- OscFloat, EnvFloat and FiltFloat use the f32 implementations, which are
+  convenient as a reference or for offline rendering.
+
+The plugin offers voices of both types.
+
+process() takes array-likes of control signals and returns numpy arrays.
+Passing contiguous numpy arrays of the expected dtype avoids any copies.
+Parameters that are constant over a block may be passed as Python or numpy
+scalars.  Anything else that is not a 1-d array (including 0-d arrays), and
+scalars out of range for an integer parameter, raise a ValueError naming the
+parameter.
+process_into() takes caller-owned output arrays ahead of the same inputs,
+writes into them, and returns the number of samples processed, so hosts
+with a fixed block size can run without allocating per block.
+"""
 from ctypes import *
+import os
 import sys
+import numpy as np
 
 _is_windows = sys.platform.startswith('win')
 
+_lib_dir = os.environ.get('CULSYNTH_LIB_DIR', '../target/release')
+
 if _is_windows:
-    _lib = CDLL('../target/debug/culsynth.dll')
+    _lib_path = os.path.join(_lib_dir, 'culsynth.dll')
 else:
-    _lib = CDLL('../target/debug/libculsynth.so')
+    _lib_path = os.path.join(_lib_dir, 'libculsynth.so')
 
-_culsynth_osc_u16_new = _lib.culsynth_osc_u16_new
-_culsynth_osc_u16_new.argtypes = []
-_culsynth_osc_u16_new.restype = c_void_p
+# (argtypes, restype) for every entrypoint used by this module.  The _new
+# and _free entrypoints are registered by each _Device subclass.
+_SIGNATURES = {
+    'culsynth_osc_u16_process_into': ([
+        c_void_p,
+        c_uint32,
+        POINTER(c_uint16),
+        POINTER(c_int16),
+        POINTER(c_uint16),
+        POINTER(c_int16),
+        POINTER(c_int16),
+        POINTER(c_int16),
+        POINTER(c_int16),
+    ], c_int32),
+    'culsynth_env_u16_process_into': ([
+        c_void_p,
+        c_uint32,
+        POINTER(c_int16),
+        POINTER(c_uint16),
+        POINTER(c_uint16),
+        POINTER(c_uint16),
+        POINTER(c_uint16),
+        POINTER(c_uint16),
+    ], c_int32),
+    'culsynth_filt_u16_process_into': ([
+        c_void_p,
+        c_uint32,
+        POINTER(c_int16),
+        POINTER(c_uint16),
+        POINTER(c_uint16),
+        POINTER(c_int16),
+        POINTER(c_int16),
+        POINTER(c_int16),
+    ], c_int32),
+    'culsynth_osc_f32_process_into': ([
+        c_void_p,
+        c_uint32,
+        POINTER(c_float),
+        POINTER(c_float),
+        POINTER(c_float),
+        POINTER(c_float),
+        POINTER(c_float),
+        POINTER(c_float),
+        POINTER(c_float),
+    ], c_int32),
+    'culsynth_env_f32_process_into': ([
+        c_void_p,
+        c_uint32,
+        POINTER(c_float),
+        POINTER(c_float),
+        POINTER(c_float),
+        POINTER(c_float),
+        POINTER(c_float),
+        POINTER(c_float),
+    ], c_int32),
+    'culsynth_filt_f32_process_into': ([
+        c_void_p,
+        c_uint32,
+        POINTER(c_float),
+        POINTER(c_float),
+        POINTER(c_float),
+        POINTER(c_float),
+        POINTER(c_float),
+        POINTER(c_float),
+    ], c_int32),
+}
 
-_culsynth_osc_u16_free = _lib.culsynth_osc_u16_free
-_culsynth_osc_u16_free.argtypes = [c_void_p]
-_culsynth_osc_u16_free.restype = None
+class _LazyLib:
+    # Loads the shared library on first use, and declares each entrypoint
+    # from _SIGNATURES the first time it is looked up.  Resolved functions
+    # are cached as attributes, so later lookups never reach __getattr__.
+    def __init__(self, path):
+        self._path = path
+        self._cdll = None
+    def __getattr__(self, name):
+        if name not in _SIGNATURES:
+            raise AttributeError(name)
+        if self._cdll is None:
+            # Functions from a CDLL (unlike a PyDLL) release the GIL for the
+            # duration of the call, so separate device instances can process
+            # concurrently from separate Python threads.
+            self._cdll = CDLL(self._path)
+        fn = self._cdll[name]
+        fn.argtypes, fn.restype = _SIGNATURES[name]
+        setattr(self, name, fn)
+        return fn
 
-_culsynth_osc_u16_process = _lib.culsynth_osc_u16_process
-_culsynth_osc_u16_process.argtypes = [
-    c_void_p,
-    c_uint32,
-    POINTER(c_uint16),
-    POINTER(c_uint16),
-    POINTER(POINTER(c_int16)),
-    POINTER(POINTER(c_int16)),
-    POINTER(POINTER(c_int16)),
-    POINTER(POINTER(c_int16)),
-    c_uint32
-]
-_culsynth_osc_u16_process.restype = c_int32
+_lib = _LazyLib(_lib_path)
 
-class OscFxP:
-    def __init__(self):
-        self.ptr = _culsynth_osc_u16_new()
-    def __del__(self):
-        _culsynth_osc_u16_free(self.ptr)
-    def process(self, note, shape):
-        num_samples = min(len(note), len(shape))
-        tri = POINTER(c_int16)()
-        sq = POINTER(c_int16)()
-        sn = POINTER(c_int16)()
-        saw = POINTER(c_int16)()
-        note_arr = (c_uint16*num_samples)(*note)
-        shape_arr = (c_uint16*num_samples)(*shape)
-        processed = 0
-        sn_list = []
-        sq_list = []
-        tri_list = []
-        saw_list = []
-        while processed < num_samples:
-            iter_proc = _culsynth_osc_u16_process(self.ptr,
-                c_uint32(num_samples - processed), note_arr, shape_arr,
-                byref(sn), byref(tri), byref(sq), byref(saw), c_uint32(processed))
-            sn_list = sn_list + sn[:iter_proc]
-            sq_list = sq_list + sq[:iter_proc]
-            tri_list = tri_list + tri[:iter_proc]
-            saw_list = saw_list + saw[:iter_proc]
-            processed += iter_proc
-        return (sn_list, sq_list, tri_list, saw_list)
+_ALIGNMENT = 64
 
-_culsynth_env_u16_new = _lib.culsynth_env_u16_new
-_culsynth_env_u16_new.argtypes = []
-_culsynth_env_u16_new.restype = c_void_p
+def _empty_aligned(num_samples, dtype):
+    # Like np.empty(), but with the data starting on a cache line boundary
+    dtype = np.dtype(dtype)
+    nbytes = num_samples*dtype.itemsize
+    raw = np.empty(nbytes + _ALIGNMENT, dtype=np.uint8)
+    offset = -raw.ctypes.data % _ALIGNMENT
+    return raw[offset:offset + nbytes].view(dtype)
 
-_culsynth_env_u16_free = _lib.culsynth_env_u16_free
-_culsynth_env_u16_free.argtypes = [c_void_p]
-_culsynth_env_u16_free.restype = None
+def _empty_rows(rows, num_samples, dtype):
+    # Allocate several equal-length arrays as rows of one block, padding
+    # each row so that every one of them starts on a cache line boundary
+    dtype = np.dtype(dtype)
+    row_bytes = -(-num_samples*dtype.itemsize // _ALIGNMENT)*_ALIGNMENT
+    stride = row_bytes // dtype.itemsize
+    block = _empty_aligned(rows*stride, dtype).reshape(rows, stride)
+    return tuple(block[i, :num_samples] for i in range(rows))
 
-_culsynth_env_u16_process = _lib.culsynth_env_u16_process
-_culsynth_env_u16_process.argtypes = [
-    c_void_p,
-    c_uint32,
-    POINTER(c_int16),
-    POINTER(c_uint16),
-    POINTER(c_uint16),
-    POINTER(c_uint16),
-    POINTER(c_uint16),
-    POINTER(POINTER(c_uint16)),
-    c_uint32
-]
-_culsynth_env_u16_process.restype = c_int32
+# Signals of these types are broadcast over the whole block.  These are
+# concrete classes rather than numbers.Number, as isinstance() against an
+# ABC is several times slower and this check runs for every argument.
+_SCALAR_TYPES = (int, float, np.number)
 
-class EnvFxP:
-    def __init__(self):
-        self.ptr = _culsynth_env_u16_new()
-    def __del__(self):
-        _culsynth_env_u16_free(self.ptr)
-    def process(self, gate, attack, decay, sustain, release):
-        num_samples = min(len(x) for x in [gate, attack, decay, sustain, release])
-        signal = POINTER(c_uint16)()
-        gate_arr = (c_int16*num_samples)(*gate)
-        attack_arr = (c_uint16*num_samples)(*attack)
-        decay_arr = (c_uint16*num_samples)(*decay)
-        sustain_arr = (c_uint16*num_samples)(*sustain)
-        release_arr = (c_uint16*num_samples)(*release)
-        processed = 0
-        output = []
-        while processed < num_samples:
-            iter_proc = _culsynth_env_u16_process(self.ptr,
-                c_uint32(num_samples - processed), gate_arr, attack_arr,
-                decay_arr, sustain_arr, release_arr, byref(signal),
-                c_uint32(processed))
-            output = output + signal[:iter_proc]
-            processed += iter_proc
-        return output
-    
-_culsynth_filt_u16_new = _lib.culsynth_filt_u16_new
-_culsynth_filt_u16_new.argtypes = []
-_culsynth_filt_u16_new.restype = c_void_p
+def _num_samples(names, *signals):
+    # Length of the shortest signal; scalars are broadcast and don't count.
+    # names is only used to say which argument was invalid.
+    lengths = []
+    for (name, x) in zip(names, signals):
+        if isinstance(x, _SCALAR_TYPES):
+            continue
+        ndim = x.ndim if isinstance(x, np.ndarray) else np.ndim(x)
+        if ndim != 1:
+            raise ValueError(name + ' must be a number or a 1-d array')
+        lengths.append(len(x))
+    if not lengths:
+        raise ValueError('at least one signal must be an array')
+    return min(lengths)
 
-_culsynth_filt_u16_free = _lib.culsynth_filt_u16_free
-_culsynth_filt_u16_free.argtypes = [c_void_p]
-_culsynth_filt_u16_free.restype = None
+def _stage(bufs, key, values, num_samples, dtype):
+    # Return values as a contiguous array of dtype.  Arrays that already
+    # match are passed through untouched; anything else is copied into a
+    # scratch buffer that is kept in bufs and reused by later calls.
+    # Scalars are broadcast, and the buffer is only refilled when the
+    # value changes, so a constant parameter costs nothing per block.
+    if (isinstance(values, np.ndarray) and values.dtype == dtype
+            and values.flags.c_contiguous):
+        return values
+    (buf, fill) = bufs.get(key, (None, None))
+    if buf is None or len(buf) < num_samples:
+        (buf, fill) = (_empty_aligned(num_samples, dtype), None)
+    if isinstance(values, _SCALAR_TYPES):
+        if fill is None or fill != values:
+            if buf.dtype.kind in 'iu':
+                info = np.iinfo(buf.dtype)
+                if not info.min <= values <= info.max:
+                    raise ValueError('%s value %r is out of range for %s'
+                        % (key, values, buf.dtype.name))
+            buf.fill(values)
+            fill = values
+    else:
+        buf[:num_samples] = values[:num_samples]
+        fill = None
+    bufs[key] = (buf, fill)
+    return buf[:num_samples]
 
-_culsynth_filt_u16_process = _lib.culsynth_filt_u16_process
-_culsynth_filt_u16_process.argtypes = [
-    c_void_p,
-    c_uint32,
-    POINTER(c_int16),
-    POINTER(c_uint16),
-    POINTER(c_uint16),
-    POINTER(POINTER(c_int16)),
-    POINTER(POINTER(c_int16)),
-    POINTER(POINTER(c_int16)),
-    c_uint32
-]
-_culsynth_filt_u16_process.restype = c_int32
+def _output(arr, dtype):
+    # Check that a caller-provided output buffer can be written to directly
+    if (not isinstance(arr, np.ndarray) or arr.ndim != 1
+            or arr.dtype != dtype or not arr.flags.c_contiguous
+            or not arr.flags.writeable):
+        raise ValueError('output buffers must be writable, contiguous 1-d '
+            'numpy arrays of dtype ' + np.dtype(dtype).name)
 
-class FiltFxP:
-    def __init__(self):
-        self.ptr = _culsynth_filt_u16_new()
-    def __del__(self):
-        _culsynth_filt_u16_free(self.ptr)
-    def process(self, input, cutoff, resonance):
-        num_samples = min(len(x) for x in [input, cutoff, resonance])
-        low = POINTER(c_int16)()
-        band = POINTER(c_int16)()
-        high = POINTER(c_int16)()
-        input_arr = (c_int16*num_samples)(*input)
-        cutoff_arr = (c_uint16*num_samples)(*cutoff)
-        resonance_arr = (c_uint16*num_samples)(*resonance)
-        processed = 0
-        low_list = []
-        band_list = []
-        high_list = []
-        while processed < num_samples:
-            iter_proc = _culsynth_filt_u16_process(self.ptr,
-                c_uint32(num_samples - processed), input_arr, cutoff_arr,
-                resonance_arr, byref(low), byref(band), byref(high),
-                c_uint32(processed))
-            low_list = low_list + low[:iter_proc]
-            band_list = band_list + band[:iter_proc]
-            high_list = high_list + high[:iter_proc]
-            processed += iter_proc
-        return (low_list, band_list, high_list)
-    
+def _check_processed(processed, num_samples):
+    # The _process_into entrypoints return the number of samples written,
+    # or a negative value if they were handed an invalid pointer
+    if processed != num_samples:
+        raise RuntimeError('DSP processed %d of %d samples'
+            % (processed, num_samples))
 
-_culsynth_osc_f32_new = _lib.culsynth_osc_f32_new
-_culsynth_osc_f32_new.argtypes = []
-_culsynth_osc_f32_new.restype = c_void_p
-
-_culsynth_osc_f32_free = _lib.culsynth_osc_f32_free
-_culsynth_osc_f32_free.argtypes = [c_void_p]
-_culsynth_osc_f32_free.restype = None
-
-_culsynth_osc_f32_process = _lib.culsynth_osc_f32_process
-_culsynth_osc_f32_process.argtypes = [
-    c_void_p,
-    c_uint32,
-    POINTER(c_float),
-    POINTER(c_float),
-    POINTER(POINTER(c_float)),
-    POINTER(POINTER(c_float)),
-    POINTER(POINTER(c_float)),
-    POINTER(POINTER(c_float)),
-    c_uint32
-]
-_culsynth_osc_f32_process.restype = c_int32
-
-class OscFloat:
+class _Device:
+    # Owns an instance of a device from the bindings library.  Subclasses
+    # pass the entrypoint prefix for the device, e.g. 'culsynth_osc_u16',
+    # and implement _process_into() using the matching _process_into
+    # function.  process() allocates the outputs and process_into()
+    # validates the caller's; both then call _process_into().
+    def __init_subclass__(cls, prefix, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._new_sym = prefix + '_new'
+        cls._free_sym = prefix + '_free'
+        _SIGNATURES[cls._new_sym] = ([], c_void_p)
+        _SIGNATURES[cls._free_sym] = ([c_void_p], None)
     def __init__(self):
-        self.ptr = _culsynth_osc_f32_new()
+        self._bufs = {}
+        # Set before _new, so __del__ sees no device if loading the library
+        # fails and doesn't retry the load from the finalizer
+        self.ptr = None
+        self.ptr = getattr(_lib, self._new_sym)()
     def __del__(self):
-        _culsynth_osc_f32_free(self.ptr)
-    def process(self, note, shape):
-        num_samples = min(len(note), len(shape))
-        tri = POINTER(c_float)()
-        sq = POINTER(c_float)()
-        sn = POINTER(c_float)()
-        saw = POINTER(c_float)()
-        note_arr = (c_float*num_samples)(*note)
-        shape_arr = (c_float*num_samples)(*shape)
-        processed = 0
-        sn_list = []
-        sq_list = []
-        tri_list = []
-        saw_list = []
-        while processed < num_samples:
-            iter_proc = _culsynth_osc_f32_process(self.ptr,
-                c_uint32(num_samples - processed), note_arr, shape_arr,
-                byref(sn), byref(tri), byref(sq), byref(saw), c_uint32(processed))
-            sn_list = sn_list + sn[:iter_proc]
-            sq_list = sq_list + sq[:iter_proc]
-            tri_list = tri_list + tri[:iter_proc]
-            saw_list = saw_list + saw[:iter_proc]
-            processed += iter_proc
-        return (sn_list, sq_list, tri_list, saw_list)
-
-_culsynth_env_f32_new = _lib.culsynth_env_f32_new
-_culsynth_env_f32_new.argtypes = []
-_culsynth_env_f32_new.restype = c_void_p
+        if not self.ptr:
+            return
+        getattr(_lib, self._free_sym)(self.ptr)
 
-_culsynth_env_f32_free = _lib.culsynth_env_f32_free
-_culsynth_env_f32_free.argtypes = [c_void_p]
-_culsynth_env_f32_free.restype = None
+class OscFxP(_Device, prefix='culsynth_osc_u16'):
+    def process(self, note, shape, tune=0):
+        num_samples = _num_samples(('note', 'shape', 'tune'), note, shape,
+            tune)
+        outputs = _empty_rows(4, num_samples, np.int16)
+        self._process_into(num_samples, *outputs, note, shape, tune)
+        return outputs
+    def process_into(self, sn, sq, tri, saw, note, shape, tune=0):
+        _output(sn, np.int16)
+        _output(sq, np.int16)
+        _output(tri, np.int16)
+        _output(saw, np.int16)
+        num_samples = _num_samples(
+            ('sn', 'sq', 'tri', 'saw', 'note', 'shape', 'tune'), sn, sq, tri,
+            saw, note, shape, tune)
+        return self._process_into(num_samples, sn, sq, tri, saw, note, shape,
+            tune)
+    def _process_into(self, num_samples, sn, sq, tri, saw, note, shape, tune):
+        note_arr = _stage(self._bufs, 'note', note,
+            num_samples, np.uint16)
+        tune_arr = _stage(self._bufs, 'tune', tune,
+            num_samples, np.int16)
+        shape_arr = _stage(self._bufs, 'shape', shape,
+            num_samples, np.uint16)
+        processed = _lib.culsynth_osc_u16_process_into(self.ptr, num_samples,
+            note_arr.ctypes.data_as(POINTER(c_uint16)),
+            tune_arr.ctypes.data_as(POINTER(c_int16)),
+            shape_arr.ctypes.data_as(POINTER(c_uint16)),
+            sn.ctypes.data_as(POINTER(c_int16)),
+            tri.ctypes.data_as(POINTER(c_int16)),
+            sq.ctypes.data_as(POINTER(c_int16)),
+            saw.ctypes.data_as(POINTER(c_int16)))
+        _check_processed(processed, num_samples)
+        return processed
 
-_culsynth_env_f32_process = _lib.culsynth_env_f32_process
-_culsynth_env_f32_process.argtypes = [
-    c_void_p,
-    c_uint32,
-    POINTER(c_float),
-    POINTER(c_float),
-    POINTER(c_float),
-    POINTER(c_float),
-    POINTER(c_float),
-    POINTER(POINTER(c_float)),
-    c_uint32
-]
-_culsynth_env_f32_process.restype = c_int32
-
-class EnvFloat:
-    def __init__(self):
-        self.ptr = _culsynth_env_f32_new()
-    def __del__(self):
-        _culsynth_env_f32_free(self.ptr)
+class EnvFxP(_Device, prefix='culsynth_env_u16'):
     def process(self, gate, attack, decay, sustain, release):
-        num_samples = min(len(x) for x in [gate, attack, decay, sustain, release])
-        signal = POINTER(c_float)()
-        gate_arr = (c_float*num_samples)(*gate)
-        attack_arr = (c_float*num_samples)(*attack)
-        decay_arr = (c_float*num_samples)(*decay)
-        sustain_arr = (c_float*num_samples)(*sustain)
-        release_arr = (c_float*num_samples)(*release)
-        processed = 0
-        output = []
-        while processed < num_samples:
-            iter_proc = _culsynth_env_f32_process(self.ptr,
-                c_uint32(num_samples - processed), gate_arr, attack_arr,
-                decay_arr, sustain_arr, release_arr, byref(signal),
-                c_uint32(processed))
-            output = output + signal[:iter_proc]
-            processed += iter_proc
+        num_samples = _num_samples(
+            ('gate', 'attack', 'decay', 'sustain', 'release'), gate, attack,
+            decay, sustain, release)
+        output = _empty_aligned(num_samples, np.uint16)
+        self._process_into(num_samples, output, gate, attack, decay, sustain,
+            release)
         return output
-    
-_culsynth_filt_f32_new = _lib.culsynth_filt_f32_new
-_culsynth_filt_f32_new.argtypes = []
-_culsynth_filt_f32_new.restype = c_void_p
+    def process_into(self, output, gate, attack, decay, sustain, release):
+        _output(output, np.uint16)
+        num_samples = _num_samples(
+            ('output', 'gate', 'attack', 'decay', 'sustain', 'release'),
+            output, gate, attack, decay, sustain, release)
+        return self._process_into(num_samples, output, gate, attack, decay,
+            sustain, release)
+    def _process_into(self, num_samples, output, gate, attack, decay, sustain,
+            release):
+        gate_arr = _stage(self._bufs, 'gate', gate,
+            num_samples, np.int16)
+        attack_arr = _stage(self._bufs, 'attack', attack,
+            num_samples, np.uint16)
+        decay_arr = _stage(self._bufs, 'decay', decay,
+            num_samples, np.uint16)
+        sustain_arr = _stage(self._bufs, 'sustain', sustain,
+            num_samples, np.uint16)
+        release_arr = _stage(self._bufs, 'release', release,
+            num_samples, np.uint16)
+        processed = _lib.culsynth_env_u16_process_into(self.ptr, num_samples,
+            gate_arr.ctypes.data_as(POINTER(c_int16)),
+            attack_arr.ctypes.data_as(POINTER(c_uint16)),
+            decay_arr.ctypes.data_as(POINTER(c_uint16)),
+            sustain_arr.ctypes.data_as(POINTER(c_uint16)),
+            release_arr.ctypes.data_as(POINTER(c_uint16)),
+            output.ctypes.data_as(POINTER(c_uint16)))
+        _check_processed(processed, num_samples)
+        return processed
 
-_culsynth_filt_f32_free = _lib.culsynth_filt_f32_free
-_culsynth_filt_f32_free.argtypes = [c_void_p]
-_culsynth_filt_f32_free.restype = None
+class FiltFxP(_Device, prefix='culsynth_filt_u16'):
+    def process(self, input, cutoff, resonance):
+        num_samples = _num_samples(('input', 'cutoff', 'resonance'), input,
+            cutoff, resonance)
+        outputs = _empty_rows(3, num_samples, np.int16)
+        self._process_into(num_samples, *outputs, input, cutoff, resonance)
+        return outputs
+    def process_into(self, low, band, high, input, cutoff, resonance):
+        _output(low, np.int16)
+        _output(band, np.int16)
+        _output(high, np.int16)
+        num_samples = _num_samples(
+            ('low', 'band', 'high', 'input', 'cutoff', 'resonance'), low, band,
+            high, input, cutoff, resonance)
+        return self._process_into(num_samples, low, band, high, input, cutoff,
+            resonance)
+    def _process_into(self, num_samples, low, band, high, input, cutoff,
+            resonance):
+        input_arr = _stage(self._bufs, 'input', input,
+            num_samples, np.int16)
+        cutoff_arr = _stage(self._bufs, 'cutoff', cutoff,
+            num_samples, np.uint16)
+        resonance_arr = _stage(self._bufs, 'resonance', resonance,
+            num_samples, np.uint16)
+        processed = _lib.culsynth_filt_u16_process_into(self.ptr, num_samples,
+            input_arr.ctypes.data_as(POINTER(c_int16)),
+            cutoff_arr.ctypes.data_as(POINTER(c_uint16)),
+            resonance_arr.ctypes.data_as(POINTER(c_uint16)),
+            low.ctypes.data_as(POINTER(c_int16)),
+            band.ctypes.data_as(POINTER(c_int16)),
+            high.ctypes.data_as(POINTER(c_int16)))
+        _check_processed(processed, num_samples)
+        return processed
 
-_culsynth_filt_f32_process = _lib.culsynth_filt_f32_process
-_culsynth_filt_f32_process.argtypes = [
-    c_void_p,
-    c_uint32,
-    POINTER(c_float),
-    POINTER(c_float),
-    POINTER(c_float),
-    POINTER(POINTER(c_float)),
-    POINTER(POINTER(c_float)),
-    POINTER(POINTER(c_float)),
-    c_uint32
-]
-_culsynth_filt_f32_process.restype = c_int32
+class OscFloat(_Device, prefix='culsynth_osc_f32'):
+    def process(self, note, shape, tune=0):
+        num_samples = _num_samples(('note', 'shape', 'tune'), note, shape,
+            tune)
+        outputs = _empty_rows(4, num_samples, np.float32)
+        self._process_into(num_samples, *outputs, note, shape, tune)
+        return outputs
+    def process_into(self, sn, sq, tri, saw, note, shape, tune=0):
+        _output(sn, np.float32)
+        _output(sq, np.float32)
+        _output(tri, np.float32)
+        _output(saw, np.float32)
+        num_samples = _num_samples(
+            ('sn', 'sq', 'tri', 'saw', 'note', 'shape', 'tune'), sn, sq, tri,
+            saw, note, shape, tune)
+        return self._process_into(num_samples, sn, sq, tri, saw, note, shape,
+            tune)
+    def _process_into(self, num_samples, sn, sq, tri, saw, note, shape, tune):
+        note_arr = _stage(self._bufs, 'note', note,
+            num_samples, np.float32)
+        tune_arr = _stage(self._bufs, 'tune', tune,
+            num_samples, np.float32)
+        shape_arr = _stage(self._bufs, 'shape', shape,
+            num_samples, np.float32)
+        processed = _lib.culsynth_osc_f32_process_into(self.ptr, num_samples,
+            note_arr.ctypes.data_as(POINTER(c_float)),
+            tune_arr.ctypes.data_as(POINTER(c_float)),
+            shape_arr.ctypes.data_as(POINTER(c_float)),
+            sn.ctypes.data_as(POINTER(c_float)),
+            tri.ctypes.data_as(POINTER(c_float)),
+            sq.ctypes.data_as(POINTER(c_float)),
+            saw.ctypes.data_as(POINTER(c_float)))
+        _check_processed(processed, num_samples)
+        return processed
 
-class FiltFloat:
-    def __init__(self):
-        self.ptr = _culsynth_filt_f32_new()
-    def __del__(self):
-        _culsynth_filt_f32_free(self.ptr)
+class EnvFloat(_Device, prefix='culsynth_env_f32'):
+    def process(self, gate, attack, decay, sustain, release):
+        num_samples = _num_samples(
+            ('gate', 'attack', 'decay', 'sustain', 'release'), gate, attack,
+            decay, sustain, release)
+        output = _empty_aligned(num_samples, np.float32)
+        self._process_into(num_samples, output, gate, attack, decay, sustain,
+            release)
+        return output
+    def process_into(self, output, gate, attack, decay, sustain, release):
+        _output(output, np.float32)
+        num_samples = _num_samples(
+            ('output', 'gate', 'attack', 'decay', 'sustain', 'release'),
+            output, gate, attack, decay, sustain, release)
+        return self._process_into(num_samples, output, gate, attack, decay,
+            sustain, release)
+    def _process_into(self, num_samples, output, gate, attack, decay, sustain,
+            release):
+        gate_arr = _stage(self._bufs, 'gate', gate,
+            num_samples, np.float32)
+        attack_arr = _stage(self._bufs, 'attack', attack,
+            num_samples, np.float32)
+        decay_arr = _stage(self._bufs, 'decay', decay,
+            num_samples, np.float32)
+        sustain_arr = _stage(self._bufs, 'sustain', sustain,
+            num_samples, np.float32)
+        release_arr = _stage(self._bufs, 'release', release,
+            num_samples, np.float32)
+        processed = _lib.culsynth_env_f32_process_into(self.ptr, num_samples,
+            gate_arr.ctypes.data_as(POINTER(c_float)),
+            attack_arr.ctypes.data_as(POINTER(c_float)),
+            decay_arr.ctypes.data_as(POINTER(c_float)),
+            sustain_arr.ctypes.data_as(POINTER(c_float)),
+            release_arr.ctypes.data_as(POINTER(c_float)),
+            output.ctypes.data_as(POINTER(c_float)))
+        _check_processed(processed, num_samples)
+        return processed
+
+class FiltFloat(_Device, prefix='culsynth_filt_f32'):
     def process(self, input, cutoff, resonance):
-        num_samples = min(len(x) for x in [input, cutoff, resonance])
-        low = POINTER(c_float)()
-        band = POINTER(c_float)()
-        high = POINTER(c_float)()
-        input_arr = (c_float*num_samples)(*input)
-        cutoff_arr = (c_float*num_samples)(*cutoff)
-        resonance_arr = (c_float*num_samples)(*resonance)
-        processed = 0
-        low_list = []
-        band_list = []
-        high_list = []
-        while processed < num_samples:
-            iter_proc = _culsynth_filt_f32_process(self.ptr,
-                c_uint32(num_samples - processed), input_arr, cutoff_arr,
-                resonance_arr, byref(low), byref(band), byref(high),
-                c_uint32(processed))
-            low_list = low_list + low[:iter_proc]
-            band_list = band_list + band[:iter_proc]
-            high_list = high_list + high[:iter_proc]
-            processed += iter_proc
-        return (low_list, band_list, high_list)
\ No newline at end of file
+        num_samples = _num_samples(('input', 'cutoff', 'resonance'), input,
+            cutoff, resonance)
+        outputs = _empty_rows(3, num_samples, np.float32)
+        self._process_into(num_samples, *outputs, input, cutoff, resonance)
+        return outputs
+    def process_into(self, low, band, high, input, cutoff, resonance):
+        _output(low, np.float32)
+        _output(band, np.float32)
+        _output(high, np.float32)
+        num_samples = _num_samples(
+            ('low', 'band', 'high', 'input', 'cutoff', 'resonance'), low, band,
+            high, input, cutoff, resonance)
+        return self._process_into(num_samples, low, band, high, input, cutoff,
+            resonance)
+    def _process_into(self, num_samples, low, band, high, input, cutoff,
+            resonance):
+        input_arr = _stage(self._bufs, 'input', input,
+            num_samples, np.float32)
+        cutoff_arr = _stage(self._bufs, 'cutoff', cutoff,
+            num_samples, np.float32)
+        resonance_arr = _stage(self._bufs, 'resonance', resonance,
+            num_samples, np.float32)
+        processed = _lib.culsynth_filt_f32_process_into(self.ptr, num_samples,
+            input_arr.ctypes.data_as(POINTER(c_float)),
+            cutoff_arr.ctypes.data_as(POINTER(c_float)),
+            resonance_arr.ctypes.data_as(POINTER(c_float)),
+            low.ctypes.data_as(POINTER(c_float)),
+            band.ctypes.data_as(POINTER(c_float)),
+            high.ctypes.data_as(POINTER(c_float)))
+        _check_processed(processed, num_samples)
+        return processed
\ No newline at end of file